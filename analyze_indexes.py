@@ -0,0 +1,602 @@
+import argparse
+import glob
+import os
+import re
+
+# Index advisor: matches the Supabase queries the app makes against the
+# indexes declared in supabase/*.sql and suggests the missing ones.
+#
+# Usage:
+#   python analyze_indexes.py
+#   python analyze_indexes.py --suggestions-out index_suggestions.sql --bench-out explain_benchmark.sql
+#   psql -d sagfo_local -f explain_benchmark.sql
+
+SQL_FILES = ['supabase/schema.sql'] + sorted(glob.glob('supabase/migrations/*.sql'))
+SOURCE_GLOBS = ['App.tsx', 'hooks/*.tsx', 'lib/*.ts', 'components/*.tsx', 'components/admin/*.tsx']
+
+# Files that only undo or clean up other migrations - their indexes don't exist after apply
+SKIP_SQL = ('001_rollback.sql', '000_limpieza_previa.sql')
+
+# Client-side filters over the already fetched lists, keyed by the camelCase
+# property the components use and mapped to the column behind it.
+CLIENT_FIELDS = {
+    'orders': {
+        'status': 'status',
+        'assignedTransporterId': 'assigned_transporter_id',
+        'userId': 'user_id',
+        'paymentMethod': 'payment_method',
+    },
+}
+CLIENT_LISTS = {'orders': 'orders', 'assignedOrders': 'orders', 'rawDisplayOrders': 'orders', 'userOrders': 'orders'}
+
+# Literals used when turning a query into an EXPLAIN statement
+SAMPLE_VALUES = {
+    'id': "'917217'",
+    'order_id': "'917217'",
+    'user_id': "'user-customer-123'",
+    'assigned_transporter_id': "'user-transporter-1'",
+    'equipment_id': "'a1b2c3d4-e5f6-7890-1234-567890abcdef'",
+    'email': "'customer@sagfo.com'",
+    'status': "'Despachado'",
+    'role': "'customer'",
+    'is_deleted': 'false',
+}
+# Primary key literals per table, so "eq('id', ...)" hits a real seed row
+SAMPLE_IDS = {
+    'users': "'user-customer-123'",
+    'equipment': "'a1b2c3d4-e5f6-7890-1234-567890abcdef'",
+    'events': "'evt-1'",
+    'gallery': "'gal-1'",
+}
+
+
+# ---------------------------------------------------------------------------
+# SQL side
+# ---------------------------------------------------------------------------
+
+CREATE_TABLE_RE = re.compile(r'CREATE TABLE (?:IF NOT EXISTS )?(?:public\.)?(\w+)\s*\((.*?)\n\);', re.S | re.I)
+CREATE_INDEX_RE = re.compile(
+    r'CREATE (UNIQUE )?INDEX (?:IF NOT EXISTS )?(\w+)\s+ON\s+(?:public\.)?(\w+)\s*'
+    r'(?:USING\s+(\w+)\s*)?\(([^;]*?)\)\s*(?:WHERE\s+([^;]*))?;',
+    re.S | re.I,
+)
+PRIMARY_KEY_RE = re.compile(r'CONSTRAINT (\w+) PRIMARY KEY \(([^)]*)\)', re.I)
+ADD_COLUMN_RE = re.compile(r'ALTER TABLE (?:public\.)?(\w+)\s+ADD COLUMN (?:IF NOT EXISTS )?(\w+)', re.I)
+
+
+def strip_sql_comments(sql):
+    return re.sub(r'--[^\n]*', '', sql)
+
+
+def index_columns(expr):
+    # "created_at DESC, status" -> ['created_at', 'status']
+    cols = []
+    for part in expr.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        m = re.match(r'"?(\w+)"?', part)
+        # Expression indexes like lower(email) are kept verbatim
+        cols.append(part if '(' in part else m.group(1))
+    return cols
+
+
+def load_schema(paths):
+    tables = {}
+    indexes = {}
+
+    for path in paths:
+        if os.path.basename(path) in SKIP_SQL or not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            sql = strip_sql_comments(f.read())
+
+        for name, body in CREATE_TABLE_RE.findall(sql):
+            cols = tables.setdefault(name, [])
+            for line in body.split('\n'):
+                line = line.strip().rstrip(',')
+                if not line or line.upper().startswith('CONSTRAINT'):
+                    continue
+                col = line.split()[0]
+                if col not in cols:
+                    cols.append(col)
+            for pk_name, pk_cols in PRIMARY_KEY_RE.findall(body):
+                indexes[pk_name] = {
+                    'name': pk_name,
+                    'table': name,
+                    'columns': index_columns(pk_cols),
+                    'unique': True,
+                    'using': None,
+                    'where': None,
+                    'source': path,
+                }
+
+        for table, col in ADD_COLUMN_RE.findall(sql):
+            cols = tables.setdefault(table, [])
+            if col not in cols:
+                cols.append(col)
+
+        for unique, name, table, using, expr, where in CREATE_INDEX_RE.findall(sql):
+            # Same index name in several migrations -> last one wins, like IF NOT EXISTS would
+            indexes[name] = {
+                'name': name,
+                'table': table,
+                'columns': index_columns(expr),
+                'unique': bool(unique),
+                'using': using.lower() or None,
+                'where': ' '.join(where.split()) if where else None,
+                'source': path,
+            }
+
+    return tables, indexes
+
+
+# ---------------------------------------------------------------------------
+# TSX side
+# ---------------------------------------------------------------------------
+
+FROM_RE = re.compile(r"\.from\(\s*['\"](\w+)['\"]\s*\)")
+# Whitespace and comments between chained calls, then ".method("
+CALL_RE = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*\.(\w+)\(", re.S)
+
+
+def ts_union(path, type_name):
+    # String literal members of "export type Name = 'a' | 'b' | ...;"
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    m = re.search(r"export type %s\s*=\s*([^;]+);" % type_name, text)
+    return re.findall(r"'([^']+)'", m.group(1)) if m else []
+
+
+def read_call_args(text, start):
+    # start points just after "(" - returns (args, index after the closing paren)
+    depth = 1
+    i = start
+    quote = None
+    while i < len(text) and depth:
+        ch = text[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in '\'"`':
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        i += 1
+    return text[start:i - 1], i
+
+
+def first_string(args):
+    m = re.match(r"\s*['\"`](.*?)['\"`]", args, re.S)
+    return m.group(1) if m else None
+
+
+PGRST_OPS = {'eq': '=', 'neq': '<>', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+
+def parse_or_filter(expr):
+    # PostgREST filter: "is_deleted.is.null,is_deleted.eq.false" -> [(col, op, value)]
+    conds = []
+    for part in expr.split(','):
+        bits = part.strip().split('.', 2)
+        if len(bits) == 3:
+            conds.append(tuple(bits))
+    return conds
+
+
+def or_to_sql(conds):
+    out = []
+    for col, op, value in conds:
+        if op == 'is':
+            out.append('%s IS %s' % (col, value.upper()))
+        elif op in PGRST_OPS:
+            literal = value if value in ('true', 'false') or value.isdigit() else "'%s'" % value
+            out.append('%s %s %s' % (col, PGRST_OPS[op], literal))
+    return '(' + ' OR '.join(out) + ')'
+
+
+def extract_queries(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    queries = []
+    for m in FROM_RE.finditer(text):
+        query = {
+            'file': path,
+            'line': text.count('\n', 0, m.start()) + 1,
+            'table': m.group(1),
+            'action': 'select',
+            'select': None,
+            'eq': [],
+            'ilike': [],
+            'or': [],
+            'order': [],
+            'single': False,
+        }
+        pos = m.end()
+        # Follow the chain while the next non-blank char is a method call
+        while True:
+            nxt = CALL_RE.match(text, pos)
+            if not nxt:
+                break
+            method = nxt.group(1)
+            args, pos = read_call_args(text, nxt.end())
+            col = first_string(args)
+
+            if method in ('insert', 'upsert', 'update', 'delete'):
+                query['action'] = method
+            elif method == 'select':
+                query['select'] = ' '.join((col or '*').split())
+            elif method in ('eq', 'neq', 'in', 'is', 'gt', 'gte', 'lt', 'lte') and col:
+                query['eq'].append(col)
+            elif method in ('ilike', 'like') and col:
+                query['ilike'].append(col)
+            elif method == 'or' and col:
+                query['or'].extend(parse_or_filter(col))
+            elif method == 'order' and col:
+                desc = re.search(r'ascending\s*:\s*false', args) is not None
+                query['order'].append((col, desc))
+            elif method in ('single', 'maybeSingle'):
+                query['single'] = True
+
+        queries.append(query)
+    return queries
+
+
+CLIENT_FILTER_RE = re.compile(r'(\w+)\.filter\(\s*\(?(\w+)\)?\s*=>(.*?)\);?\n', re.S)
+
+
+def extract_client_filters(path):
+    # Admin views filter the full orders list in the browser; these are the
+    # filters that would move server-side once the list gets paginated.
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    found = []
+    for m in CLIENT_FILTER_RE.finditer(text):
+        lst, var, body = m.groups()
+        table = CLIENT_LISTS.get(lst)
+        if not table:
+            continue
+        fields = CLIENT_FIELDS[table]
+        cols = []
+        for prop in re.findall(r'\b%s\.(\w+)\s*(?:===|!==)' % re.escape(var), body):
+            if prop in fields and fields[prop] not in cols:
+                cols.append(fields[prop])
+        if cols:
+            found.append({
+                'file': path,
+                'line': text.count('\n', 0, m.start()) + 1,
+                'table': table,
+                'columns': cols,
+            })
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Matching
+# ---------------------------------------------------------------------------
+
+def find_covering_index(indexes, table, filter_cols, order_cols):
+    # A btree index helps when its leading column is one of the filter columns
+    # (or the sort column when nothing is filtered).
+    best = None
+    for idx in indexes.values():
+        if idx['table'] != table:
+            continue
+        cols = idx['columns']
+        if filter_cols:
+            if cols[0] not in filter_cols:
+                continue
+            prefix = 0
+            for c in cols:
+                if c in filter_cols:
+                    prefix += 1
+                else:
+                    break
+            score = prefix * 2
+            rest = cols[prefix:]
+            if order_cols and rest and rest[0] == order_cols[0]:
+                score += 1
+        elif order_cols:
+            if cols[0] != order_cols[0]:
+                continue
+            score = 1
+        else:
+            continue
+        if best is None or score > best[0]:
+            best = (score, idx)
+    return best[1] if best else None
+
+
+def partial_index_for(indexes, table, cols):
+    for idx in indexes.values():
+        if idx['table'] == table and idx['where'] and all(c in idx['where'] for c in cols):
+            return idx
+    return None
+
+
+def suggest_name(table, cols, using=None, taken=()):
+    # "email gin_trgm_ops" -> email + _trgm suffix, "lower(email)" -> lower_email
+    parts = []
+    for c in cols:
+        bits = c.split()
+        if '(' in bits[0]:
+            parts.append(re.sub(r'\W+', '_', bits[0]).strip('_'))
+        else:
+            parts.append(bits[0])
+    name = 'idx_%s_%s' % (table, '_'.join(parts))
+    if using == 'gin' and any(c.endswith('gin_trgm_ops') for c in cols):
+        name += '_trgm'
+    elif using:
+        name += '_' + using
+    # Never reuse the name of an index the migrations already create: IF NOT EXISTS
+    # would silently skip the CREATE and the rollback line would drop the old one.
+    base, n = name, 2
+    while name in taken:
+        name = '%s_%d' % (base, n)
+        n += 1
+    return name
+
+
+def analyze(queries, client_filters, tables, indexes):
+    findings = []
+    suggestions = {}
+
+    def suggest(table, cols, reason, using=None):
+        key = (table, tuple(cols), using)
+        if key in suggestions:
+            suggestions[key]['reasons'].append(reason)
+            return
+        suggestions[key] = {'table': table, 'columns': cols, 'using': using, 'reasons': [reason]}
+
+    for q in queries:
+        where = '%s:%d' % (q['file'], q['line'])
+        if q['action'] == 'insert':
+            continue
+
+        filter_cols = list(dict.fromkeys(q['eq']))
+        order_cols = [c for c, _ in q['order']]
+
+        if q['table'] not in tables:
+            findings.append((where, q, 'unknown table', None))
+            continue
+
+        or_cols = list(dict.fromkeys(c for c, _, _ in q['or']))
+        for col in filter_cols + q['ilike'] + or_cols + order_cols:
+            if col not in tables[q['table']]:
+                findings.append((where, q, 'column %s not in schema' % col, None))
+
+        if filter_cols or order_cols:
+            idx = find_covering_index(indexes, q['table'], filter_cols, order_cols)
+            if idx:
+                findings.append((where, q, 'ok', idx))
+                # Equality + sort served by two separate indexes -> composite avoids the sort
+                if filter_cols and order_cols and order_cols[0] not in idx['columns']:
+                    cols = filter_cols + ['%s DESC' % c if d else c for c, d in q['order']]
+                    suggest(q['table'], cols, '%s filters and sorts' % where)
+            else:
+                findings.append((where, q, 'no index', None))
+                cols = filter_cols + ['%s DESC' % c if d else c for c, d in q['order']]
+                suggest(q['table'], cols, where)
+
+        for col in q['ilike']:
+            # ilike can't use a plain btree. Without wildcards it's really a case
+            # insensitive equality: lower(col) btree once the query compares lower()
+            # values; trigram GIN serves the ilike as written (and patterns).
+            suggest(q['table'], ['lower(%s)' % col],
+                    '%s uses ilike without wildcards -> query lower(%s) = lower(value)' % (where, col))
+            suggest(q['table'], ['%s gin_trgm_ops' % col], '%s uses ilike' % where, using='gin')
+            findings.append((where, q, 'ilike on %s needs lower() or pg_trgm index' % col, None))
+
+        if q['or']:
+            idx = partial_index_for(indexes, q['table'], or_cols)
+            if idx:
+                findings.append((where, q, 'or-filter matches partial index', idx))
+            elif not filter_cols:
+                findings.append((where, q, 'or-filter without index', None))
+
+    for cf in client_filters:
+        where = '%s:%d' % (cf['file'], cf['line'])
+        idx = find_covering_index(indexes, cf['table'], cf['columns'], ['created_at'])
+        q = {'table': cf['table'], 'action': 'client filter', 'eq': cf['columns'], 'order': [('created_at', True)]}
+        findings.append((where, q, 'client-side' if idx else 'client-side, no index', idx))
+        # Pushing these filters to Supabase means "WHERE col = ? ORDER BY created_at DESC"
+        if idx is None or 'created_at' not in ' '.join(idx['columns']):
+            suggest(cf['table'], cf['columns'] + ['created_at DESC'], '%s (client-side filter)' % where)
+
+    # Drop suggestions already satisfied by an existing index with the same leading columns
+    pruned = []
+    for s in suggestions.values():
+        plain = [c.split()[0] for c in s['columns']]
+        covered = any(
+            idx['table'] == s['table'] and idx['using'] == s['using'] and [c.split()[0] for c in idx['columns'][:len(plain)]] == plain
+            for idx in indexes.values()
+        )
+        if not covered:
+            taken = set(indexes) | {p['name'] for p in pruned}
+            s['name'] = suggest_name(s['table'], s['columns'], s['using'], taken)
+            pruned.append(s)
+
+    return findings, pruned
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def render_suggestions(suggestions):
+    lines = [
+        '-- ============================================',
+        '-- ÍNDICES SUGERIDOS (generado por analyze_indexes.py)',
+        '-- ============================================',
+        '',
+    ]
+    if any(s['using'] == 'gin' for s in suggestions):
+        lines += ['CREATE EXTENSION IF NOT EXISTS pg_trgm;', '']
+    for s in suggestions:
+        for reason in s['reasons']:
+            lines.append('-- %s' % reason)
+        using = ' USING %s ' % s['using'] if s['using'] else ''
+        lines.append('CREATE INDEX IF NOT EXISTS %s ON public.%s%s(%s);' % (
+            s['name'], s['table'], using, ', '.join(s['columns'])))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def explain_sql(q):
+    where = []
+    for col in dict.fromkeys(q['eq']):
+        if col == 'id':
+            value = SAMPLE_IDS.get(q['table'], SAMPLE_VALUES['id'])
+        else:
+            value = SAMPLE_VALUES.get(col, "'x'")
+        where.append('%s = %s' % (col, value))
+    for col in q.get('ilike', []):
+        where.append('%s ILIKE %s' % (col, SAMPLE_VALUES.get(col, "'x'")))
+    if q.get('or'):
+        where.append(or_to_sql(q['or']))
+    sql = 'SELECT * FROM public.%s' % q['table']
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    if q['order']:
+        sql += ' ORDER BY ' + ', '.join('%s DESC' % c if d else c for c, d in q['order'])
+    if q.get('single'):
+        sql += ' LIMIT 1'
+    return sql
+
+
+def render_benchmark(findings, suggestions, seed_orders):
+    lines = [
+        '-- ============================================',
+        '-- EXPLAIN BENCHMARK (generado por analyze_indexes.py)',
+        '-- Ejecutar contra un Postgres LOCAL: psql -d sagfo_local -f <este archivo>',
+        '-- ============================================',
+        '',
+        '\\timing on',
+        '',
+    ]
+    if seed_orders:
+        # Real OrderStatus values, so the statistics and the status filters match the app
+        statuses = ts_union('types.ts', 'OrderStatus')
+        status_array = ', '.join("'%s'" % st.replace("'", "''") for st in statuses)
+        lines += [
+            '-- Datos sintéticos para que el planner tenga algo que medir',
+            "INSERT INTO public.orders (id, user_id, status, payment_method, assigned_transporter_id, created_at)",
+            "SELECT 'bench-' || g,",
+            "       (ARRAY['user-customer-123', 'user-pedro-456'])[1 + g % 2],",
+            "       (ARRAY[%s])[1 + g %% %d]," % (status_array, len(statuses)),
+            "       'mixed',",
+            "       CASE WHEN g % 3 = 0 THEN 'user-transporter-1' END,",
+            "       now() - (g || ' minutes')::interval",
+            'FROM generate_series(1, %d) AS g' % seed_orders,
+            'ON CONFLICT (id) DO NOTHING;',
+            '',
+        ]
+    lines += ['ANALYZE;', '']
+
+    queries = []
+    seen = set()
+    for where, q, status, _ in findings:
+        if q['action'] not in ('select', 'client filter', 'update', 'delete'):
+            continue
+        if not (q['eq'] or q.get('ilike') or q.get('or') or q['order']):
+            continue
+        sql = explain_sql(q)
+        if sql in seen:
+            continue
+        seen.add(sql)
+        queries.append((where, sql))
+        if q.get('ilike'):
+            # The same lookup written the way a lower(col) index can serve it
+            rewritten = re.sub(r"(\w+) ILIKE ('[^']*')", r'lower(\1) = lower(\2)', sql)
+            if rewritten not in seen:
+                seen.add(rewritten)
+                queries.append(('%s (lower() rewrite)' % where, rewritten))
+
+    def block(title):
+        out = ['-- ---------- %s ----------' % title]
+        for where, sql in queries:
+            out.append('-- %s' % where)
+            out.append('EXPLAIN (ANALYZE, BUFFERS) %s;' % sql)
+        out.append('')
+        return out
+
+    lines += block('ANTES')
+    if suggestions:
+        lines += [render_suggestions(suggestions), 'ANALYZE;', '']
+        lines += block('DESPUÉS')
+        lines.append('-- Para volver al estado anterior:')
+        for s in suggestions:
+            lines.append('-- DROP INDEX IF EXISTS public.%s;' % s['name'])
+    if seed_orders:
+        lines.append("DELETE FROM public.orders WHERE id LIKE 'bench-%';")
+    return '\n'.join(lines) + '\n'
+
+
+def describe(q):
+    parts = [q['action'], q['table']]
+    if q['eq']:
+        parts.append('eq=' + ','.join(q['eq']))
+    if q.get('ilike'):
+        parts.append('ilike=' + ','.join(q['ilike']))
+    if q.get('or'):
+        parts.append('or=' + ','.join('.'.join(c) for c in q['or']))
+    if q['order']:
+        parts.append('order=' + ','.join(('%s desc' % c) if d else c for c, d in q['order']))
+    return ' '.join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suggest indexes for the Supabase queries used by the app.')
+    parser.add_argument('--suggestions-out', help='write CREATE INDEX suggestions to this file')
+    parser.add_argument('--bench-out', help='write an EXPLAIN benchmark script (psql) to this file')
+    parser.add_argument('--seed-orders', type=int, default=0,
+                        help='rows of synthetic orders the benchmark script inserts before running')
+    args = parser.parse_args()
+
+    tables, indexes = load_schema(SQL_FILES)
+
+    sources = []
+    for pattern in SOURCE_GLOBS:
+        sources.extend(sorted(glob.glob(pattern)))
+
+    queries = []
+    client_filters = []
+    for path in sources:
+        queries.extend(extract_queries(path))
+        client_filters.extend(extract_client_filters(path))
+
+    findings, suggestions = analyze(queries, client_filters, tables, indexes)
+
+    print(f"Tables: {len(tables)}  Indexes: {len(indexes)}  Queries: {len(queries)}  Client filters: {len(client_filters)}")
+    print()
+    for where, q, status, idx in findings:
+        icon = '✅' if idx else '⚠️ '
+        using = ' -> %s' % idx['name'] if idx else ''
+        print(f"{icon} {where:45} {describe(q)}  [{status}{using}]")
+
+    print()
+    if suggestions:
+        print(f"💡 {len(suggestions)} suggested index(es):")
+        print(render_suggestions(suggestions))
+    else:
+        print("✅ Every filtered query is covered by an existing index.")
+
+    if args.suggestions_out:
+        with open(args.suggestions_out, 'w', encoding='utf-8') as f:
+            f.write(render_suggestions(suggestions))
+        print(f"Wrote {args.suggestions_out}")
+
+    if args.bench_out:
+        with open(args.bench_out, 'w', encoding='utf-8') as f:
+            f.write(render_benchmark(findings, suggestions, args.seed_orders))
+        print(f"Wrote {args.bench_out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,329 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Collects every image the app references (data/*.ts, TSX sources, index.html)
+# into a manifest with srcset metadata for the components.
+#
+# - Images under public/ get resized WebP/AVIF variants in public/variants/,
+#   built in parallel. Sources whose content hash didn't change are skipped.
+# - Unsplash URLs get a srcset built by rewriting their w= parameter.
+#
+# Everything runs offline against local files. Resizing needs Pillow
+# (pip install Pillow); AVIF needs Pillow >= 11.3 or pillow-avif-plugin.
+# Without Pillow the manifest is still written, just without local variants.
+#
+# Usage:
+#   python build_image_manifest.py
+#   python build_image_manifest.py --widths 320,640,960 --json image-manifest.json
+
+SOURCE_GLOBS = ['data/*.ts', 'App.tsx', 'index.tsx', 'components/**/*.tsx', 'index.html']
+PUBLIC_DIR = 'public'
+VARIANTS_DIR = os.path.join(PUBLIC_DIR, 'variants')
+CACHE_FILE = '.image_variants_cache.json'
+TS_OUT = 'data/imageManifest.ts'
+
+DEFAULT_WIDTHS = [160, 320, 480, 640, 960, 1280, 1920]
+QUALITY = {'webp': 80, 'avif': 60}
+MIME = {'webp': 'image/webp', 'avif': 'image/avif'}
+IMAGE_EXT = ('.png', '.jpg', '.jpeg', '.webp', '.gif', '.avif')
+
+# Start-of-frame markers carry the dimensions: C0-CF except DHT (C4), JPG (C8)
+# and DAC (CC). RSTn, SOI and TEM have no length field.
+JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+JPEG_STANDALONE = set(range(0xD0, 0xD9)) | {0x01}
+
+STRING_RE = re.compile(r'"([^"\n]+)"|\'([^\'\n]+)\'')
+
+
+# ---------------------------------------------------------------------------
+# References
+# ---------------------------------------------------------------------------
+
+def classify(value):
+    path = urlsplit(value).path.lower()
+    if value.startswith('https://images.unsplash.com/'):
+        return 'unsplash'
+    if value.startswith(('http://', 'https://')):
+        return 'remote' if path.endswith(IMAGE_EXT) else None
+    if value.startswith('/') and path.endswith(IMAGE_EXT):
+        return 'local'
+    return None
+
+
+def collect_refs(patterns, exclude=()):
+    refs = {}
+    seen = {os.path.normpath(p) for p in exclude}
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            path = os.path.normpath(path)
+            if path in seen:
+                continue
+            seen.add(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            for m in STRING_RE.finditer(text):
+                value = m.group(1) or m.group(2)
+                kind = classify(value)
+                if not kind:
+                    continue
+                line = text.count('\n', 0, m.start()) + 1
+                entry = refs.setdefault(value, {'kind': kind, 'refs': []})
+                entry['refs'].append('%s:%d' % (path, line))
+    return refs
+
+
+# ---------------------------------------------------------------------------
+# Local files
+# ---------------------------------------------------------------------------
+
+def image_size(path):
+    # PNG / JPEG / GIF dimensions from the header, no Pillow needed.
+    # Truncated or unrecognised files return None.
+    with open(path, 'rb') as f:
+        head = f.read(32)
+        if head.startswith(b'\x89PNG\r\n\x1a\n') and len(head) >= 24:
+            return struct.unpack('>II', head[16:24])
+        if head[:6] in (b'GIF87a', b'GIF89a') and len(head) >= 10:
+            return struct.unpack('<HH', head[6:10])
+        if head.startswith(b'\xff\xd8'):
+            f.seek(2)
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                if marker[1] == 0xFF:
+                    # Fill byte before the real marker
+                    f.seek(-1, 1)
+                    continue
+                if marker[1] in JPEG_STANDALONE:
+                    continue
+                segment = f.read(2)
+                if len(segment) < 2:
+                    return None
+                length = struct.unpack('>H', segment)[0]
+                if marker[1] in JPEG_SOF:
+                    frame = f.read(5)
+                    if len(frame) < 5:
+                        return None
+                    h, w = struct.unpack('>xHH', frame)
+                    return w, h
+                f.seek(length - 2, 1)
+    return None
+
+
+def probe(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return path, h.hexdigest(), image_size(path)
+
+
+def variant_widths(width, widths):
+    out = [w for w in widths if w < width]
+    if width <= max(widths):
+        out.append(width)
+    return out
+
+
+def variant_path(src, width, fmt):
+    rel = os.path.splitext(os.path.relpath(src, PUBLIC_DIR))[0]
+    return os.path.join(VARIANTS_DIR, '%s-%dw.%s' % (rel, width, fmt))
+
+
+def public_url(path):
+    return '/' + os.path.relpath(path, PUBLIC_DIR).replace(os.sep, '/')
+
+
+def render_variants(job):
+    # Runs in a worker process
+    src, outputs = job
+    from PIL import Image
+
+    with Image.open(src) as im:
+        im.load()
+        for width, fmt, out in outputs:
+            height = round(im.height * width / im.width)
+            resized = im if width == im.width else im.resize((width, height), Image.LANCZOS)
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+            resized.save(out, fmt.upper(), quality=QUALITY[fmt])
+    return src
+
+
+def available_formats():
+    try:
+        from PIL import features
+    except ImportError:
+        return []
+    formats = ['webp'] if features.check('webp') else []
+    try:
+        import pillow_avif  # noqa: F401  (registers the AVIF plugin)
+        formats.append('avif')
+    except ImportError:
+        if features.check('avif'):
+            formats.append('avif')
+    return formats
+
+
+def load_cache(path):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+# ---------------------------------------------------------------------------
+# Remote (Unsplash) srcsets
+# ---------------------------------------------------------------------------
+
+def unsplash_srcset(url, widths):
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    original = int(query.get('w', max(widths)))
+    out = []
+    for w in variant_widths(original, widths):
+        query['w'] = str(w)
+        query.setdefault('auto', 'format')
+        out.append('%s %dw' % (urlunsplit(parts._replace(query=urlencode(query, safe=','))), w))
+    return ', '.join(out), original
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def render_ts(manifest):
+    lines = [
+        '// Generado por build_image_manifest.py - no editar a mano.',
+        '',
+        'export interface ImageVariantSource {',
+        '  type: string;',
+        '  srcSet: string;',
+        '}',
+        '',
+        'export interface ImageVariantInfo {',
+        '  width?: number;',
+        '  height?: number;',
+        '  srcSet?: string;',
+        '  sources?: ImageVariantSource[];',
+        '}',
+        '',
+        'export const imageManifest: Record<string, ImageVariantInfo> = {',
+    ]
+    for src in sorted(manifest):
+        info = {k: v for k, v in manifest[src].items() if k in ('width', 'height', 'srcSet', 'sources') and v}
+        if not info:
+            continue
+        lines.append('  %s: %s,' % (json.dumps(src), json.dumps(info, ensure_ascii=False)))
+    lines.append('};')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the image manifest and local responsive variants.')
+    parser.add_argument('--widths', default=','.join(map(str, DEFAULT_WIDTHS)),
+                        help='comma separated target widths (default: %(default)s)')
+    parser.add_argument('--ts', default=TS_OUT, help='TS module with srcset metadata (default: %(default)s)')
+    parser.add_argument('--json', help='also write the full manifest as JSON')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help='ignore the cache and rebuild every variant')
+    args = parser.parse_args()
+
+    widths = sorted(int(w) for w in args.widths.split(','))
+    # The generated module lives in data/ too; don't read our own srcsets back
+    refs = collect_refs(SOURCE_GLOBS, exclude=[args.ts])
+    formats = available_formats()
+    if not formats:
+        print("⚠️  Pillow not installed (pip install Pillow): local variants will be skipped.")
+    elif 'avif' not in formats:
+        print("⚠️  No AVIF support in Pillow: only WebP variants will be built.")
+
+    cache = {} if args.force else load_cache(CACHE_FILE)
+
+    local = {}
+    for url, entry in refs.items():
+        if entry['kind'] == 'local':
+            path = os.path.join(PUBLIC_DIR, urlsplit(url).path.lstrip('/'))
+            if os.path.exists(path):
+                local[url] = os.path.normpath(path)
+            else:
+                entry['missing'] = True
+
+    manifest = {}
+    rebuilt = skipped = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        probes = {path: (sha, size) for path, sha, size in pool.map(probe, sorted(set(local.values())))}
+
+        jobs = []
+        planned = {}
+        for path, (sha, size) in probes.items():
+            if not size:
+                print(f"⚠️  Could not read the size of {path}: no variants for it.")
+                continue
+            outputs = [(w, fmt, variant_path(path, w, fmt))
+                       for fmt in formats for w in variant_widths(size[0], widths)]
+            planned[path] = outputs
+            cached = cache.get(path)
+            up_to_date = (cached and cached['sha256'] == sha
+                          and all(os.path.exists(o) for _, _, o in outputs)
+                          and sorted(cached['outputs']) == sorted(o for _, _, o in outputs))
+            if outputs and not up_to_date:
+                jobs.append((path, outputs))
+            elif outputs:
+                skipped += 1
+
+        for src in pool.map(render_variants, jobs):
+            sha, _ = probes[src]
+            cache[src] = {'sha256': sha, 'outputs': [o for _, _, o in planned[src]]}
+            rebuilt += 1
+
+    for url, entry in refs.items():
+        info = {'kind': entry['kind'], 'refs': entry['refs']}
+        if entry.get('missing'):
+            info['missing'] = True
+        elif entry['kind'] == 'local':
+            path = local[url]
+            sha, size = probes[path]
+            if size:
+                info['width'], info['height'] = size
+            sources = []
+            for fmt in formats:
+                outs = [(w, o) for w, f, o in planned.get(path, []) if f == fmt and os.path.exists(o)]
+                if outs:
+                    sources.append({'type': MIME[fmt],
+                                    'srcSet': ', '.join('%s %dw' % (public_url(o), w) for w, o in outs)})
+            # AVIF first so <picture> picks the smallest format the browser supports
+            info['sources'] = sorted(sources, key=lambda s: s['type'] != MIME['avif'])
+        elif entry['kind'] == 'unsplash':
+            info['srcSet'], info['width'] = unsplash_srcset(url, widths)
+        manifest[url] = info
+
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    with open(args.ts, 'w', encoding='utf-8') as f:
+        f.write(render_ts(manifest))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    kinds = {}
+    for info in manifest.values():
+        kinds[info['kind']] = kinds.get(info['kind'], 0) + 1
+    print(f"Images: {len(manifest)} ({', '.join(f'{v} {k}' for k, v in sorted(kinds.items()))})")
+    for url, info in sorted(manifest.items()):
+        if info.get('missing'):
+            print(f"❌ {url} not found under {PUBLIC_DIR}/ ({info['refs'][0]})")
+    print(f"Variants: {rebuilt} source(s) rebuilt, {skipped} unchanged")
+    print(f"✅ Wrote {args.ts}" + (f" and {args.json}" if args.json else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+import argparse
+import glob
+import gzip
+import json
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+# Finds which custom selectors in index.css are still used by the app and
+# writes a pruned stylesheet plus a usage report.
+#
+# Every string literal in the sources is split into class tokens (variant
+# prefixes like "dark:hover:" are dropped), the same way Tailwind scans its
+# content files. A selector is kept when all the classes it mentions show up
+# somewhere; selectors without classes (body, *, ::selection...) are always kept.
+#
+# Usage:
+#   python scan_css_usage.py
+#   python scan_css_usage.py --out index.pruned.css --report css_usage_report.json
+
+CSS_FILE = 'index.css'
+SOURCE_GLOBS = ['App.tsx', 'index.tsx', 'index.html', 'components/**/*.tsx', 'hooks/**/*.tsx',
+                'data/**/*.ts',
+                # Not in tailwind.config.js content, but getStatusColor() & co. return class strings
+                'lib/**/*.ts']
+
+STRING_RE = re.compile(r'"[^"\n]*"|\'[^\'\n]*\'|`[^`]*`')
+TOKEN_RE = re.compile(r'[^\s"\'`{}()<>=,;]+')
+CLASS_RE = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+ANIMATION_RE = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)')
+WS_RE = re.compile(r'\s*')
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+def scan_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    tokens = set()
+    for literal in STRING_RE.findall(text):
+        for token in TOKEN_RE.findall(literal[1:-1]):
+            token = token.lstrip('!')
+            # md:hover:premium-button -> premium-button (but keep bg-[url(x:y)] intact)
+            if '[' not in token:
+                token = token.rsplit(':', 1)[-1]
+            if token:
+                tokens.add(token)
+
+    # Inline styles can reference keyframes defined in index.css
+    animations = set()
+    for value in re.findall(r'animation(?:Name)?\s*:\s*[\'"`]([^\'"`]+)', text):
+        animations.update(value.replace(',', ' ').split())
+    return path, tokens, animations
+
+
+def collect_sources(patterns):
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def scan_sources(paths, workers):
+    usage = {}
+    animations = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path, tokens, anims in pool.map(scan_file, paths, chunksize=8):
+            for token in tokens:
+                usage.setdefault(token, []).append(path)
+            animations |= anims
+    return usage, animations
+
+
+# ---------------------------------------------------------------------------
+# CSS
+# ---------------------------------------------------------------------------
+
+def parse_css(css, start=0, end=None):
+    # Returns a list of nodes:
+    #   ('raw', text)                       comments, @tailwind / @import lines
+    #   ('rule', selector, body)            normal rules
+    #   ('at', prelude, children_or_body)   @media/@supports (children) or @keyframes/@font-face (body)
+    end = len(css) if end is None else end
+    nodes = []
+    i = start
+    while i < end:
+        m = WS_RE.match(css, i)
+        if m.end() > i:
+            nodes.append(('raw', m.group(0)))
+            i = m.end()
+        if i >= end:
+            break
+
+        if css.startswith('/*', i):
+            close = css.find('*/', i + 2)
+            close = end if close == -1 else close + 2
+            nodes.append(('raw', css[i:close]))
+            i = close
+            continue
+
+        brace = css.find('{', i, end)
+        semi = css.find(';', i, end)
+        if brace == -1 or (semi != -1 and semi < brace):
+            # Statement at-rule, e.g. "@tailwind base;"
+            stop = end if semi == -1 else semi + 1
+            nodes.append(('raw', css[i:stop]))
+            i = stop
+            continue
+
+        prelude = css[i:brace].strip()
+        close = matching_brace(css, brace)
+        body = css[brace + 1:close]
+        if prelude.startswith('@') and re.match(r'@(media|supports|layer)\b', prelude):
+            nodes.append(('at', prelude, parse_css(css, brace + 1, close)))
+        elif prelude.startswith('@'):
+            nodes.append(('at', prelude, body))
+        else:
+            nodes.append(('rule', prelude, body))
+        i = close + 1
+    return nodes
+
+
+def matching_brace(css, open_at):
+    depth = 0
+    i = open_at
+    while i < len(css):
+        if css.startswith('/*', i):
+            i = css.find('*/', i + 2) + 2
+            continue
+        ch = css[i]
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+def split_selectors(selector):
+    # Split on top-level commas only (":is(.a, .b)" stays together)
+    parts = []
+    depth = 0
+    current = ''
+    for ch in selector:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += ch
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def drop_leading_comment(out, floor=0):
+    # A "/* Truncate Text */" style comment right above a removed rule goes with it.
+    # Only a single line break may separate them (a blank line means it's a section
+    # header), and nothing before `floor` (an earlier removed rule) is touched.
+    j = len(out) - 1
+    if j >= floor and not out[j].strip():
+        if out[j].count('\n') > 1:
+            return
+        j -= 1
+    if j >= floor and out[j].strip().startswith('/*'):
+        del out[j:]
+
+
+def prune(nodes, usage, keep, report, context=''):
+    out = []
+    floor = 0
+    for node in nodes:
+        kind = node[0]
+        if kind == 'raw':
+            out.append(node[1])
+            continue
+
+        if kind == 'at':
+            prelude, inner = node[1], node[2]
+            if isinstance(inner, list):
+                children = prune(inner, usage, keep, report, prelude)
+                # Drop @media blocks that end up with nothing but whitespace/comments
+                if any(not c.strip().startswith('/*') and c.strip() for c in children):
+                    out.append('%s {%s}' % (prelude, ''.join(children)))
+                else:
+                    drop_leading_comment(out, floor)
+                    floor = len(out)
+            else:
+                out.append('%s {%s}' % (prelude, inner))
+            continue
+
+        selector, body = node[1], node[2]
+        selectors = split_selectors(selector)
+        kept = []
+        for sel in selectors:
+            classes = CLASS_RE.findall(re.sub(r'\[[^\]]*\]', '', sel))
+            missing = [c for c in classes if c not in usage and c not in keep]
+            entry = {
+                'selector': sel,
+                'media': context or None,
+                'classes': classes,
+                'used': not missing,
+                'missing': missing,
+                'files': sorted({f for c in classes for f in usage.get(c, [])}),
+            }
+            report['selectors'].append(entry)
+            if not missing:
+                kept.append(sel)
+
+        if len(kept) == len(selectors):
+            # Untouched rule: keep the selector list as written
+            out.append('%s {%s}' % (selector, body))
+        elif kept:
+            out.append('%s {%s}' % (',\n'.join(kept), body))
+        else:
+            drop_leading_comment(out, floor)
+            floor = len(out)
+    return out
+
+
+def prune_keyframes(css, animations):
+    # Keyframes only survive if a kept rule (or an inline style) still animates with them
+    referenced = set(animations)
+    for value in ANIMATION_RE.findall(css):
+        referenced.update(re.findall(r'[\w-]+', value))
+
+    removed = []
+
+    def drop(m):
+        if m.group(1) in referenced:
+            return m.group(0)
+        removed.append(m.group(1))
+        return ''
+
+    # Comments directly above a dropped keyframes block go with it
+    out = re.sub(r'(?:/\*[^*]*\*/\s*)?@keyframes\s+([\w-]+)\s*\{(?:[^{}]*\{[^{}]*\})*\s*\}\s*', drop, css)
+    return out, removed
+
+
+def gzip_size(text):
+    return len(gzip.compress(text.encode('utf-8'), 9))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report unused custom selectors in index.css.')
+    parser.add_argument('--css', default=CSS_FILE)
+    parser.add_argument('--out', help='write the pruned stylesheet here')
+    parser.add_argument('--report', help='write a JSON usage report here')
+    parser.add_argument('--keep', action='append', default=[],
+                        help='class to always keep (repeatable), e.g. classes built at runtime')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    sources = collect_sources(SOURCE_GLOBS)
+    usage, animations = scan_sources(sources, args.workers)
+
+    with open(args.css, 'r', encoding='utf-8') as f:
+        css = f.read()
+
+    report = {'css': args.css, 'sources': sources, 'selectors': []}
+    pruned = ''.join(prune(parse_css(css), usage, set(args.keep), report))
+    pruned, removed_keyframes = prune_keyframes(pruned, animations)
+    pruned = re.sub(r'\n{3,}', '\n\n', pruned)
+    report['removed_keyframes'] = removed_keyframes
+
+    unused = [s for s in report['selectors'] if not s['used']]
+    used = [s for s in report['selectors'] if s['used'] and s['classes']]
+
+    print(f"Scanned {len(sources)} files, {len(usage)} distinct tokens")
+    print(f"Selectors in {args.css}: {len(report['selectors'])} "
+          f"({len(used)} used custom, {len(unused)} unused)")
+    print()
+    for s in unused:
+        where = ' @ %s' % s['media'] if s['media'] else ''
+        print(f"❌ {s['selector']}{where}  (missing: {', '.join(s['missing'])})")
+    for name in removed_keyframes:
+        print(f"❌ @keyframes {name}")
+    print()
+    before, after = len(css.encode('utf-8')), len(pruned.encode('utf-8'))
+    print(f"Size: {before:,} -> {after:,} bytes  (gzip {gzip_size(css):,} -> {gzip_size(pruned):,})")
+
+    report['bytes'] = {'before': before, 'after': after,
+                       'gzip_before': gzip_size(css), 'gzip_after': gzip_size(pruned)}
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(pruned)
+        print(f"Wrote {args.out}")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Wrote {args.report}")
+
+
+if __name__ == '__main__':
+    main()
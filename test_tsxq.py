@@ -0,0 +1,192 @@
+import os
+import tempfile
+import unittest
+
+from tsxq import KIND, NAME, TEXT, Index, QueryError, TsxParser, apply_edits, compile_query, plan_edit
+
+# Run with:  python -m pytest test_tsxq.py   (or python -m unittest test_tsxq)
+
+NESTED = '''export const Card = () => (
+  <div>
+    <Box>
+      <span>a</span>
+      <Box>
+        <span>b</span>
+      </Box>
+    </Box>
+    <p>after</p>
+  </div>
+);
+'''
+
+
+def index_for(tmp, source, name='A.tsx'):
+    path = os.path.join(tmp, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    index = Index(os.path.join(tmp, 'index'))
+    index.refresh([path])
+    return index
+
+
+class ParserTest(unittest.TestCase):
+    def parse(self, source):
+        return TsxParser(source).parse()
+
+    def test_and_condition(self):
+        nodes = self.parse('const v = <div>{isOpen && (<A />)}</div>;')
+        conds = [n for n in nodes if n[KIND] == 'cond']
+        self.assertEqual([(n[NAME], n[TEXT]) for n in conds], [('&&', 'isOpen')])
+
+    def test_ternary_condition(self):
+        nodes = self.parse("const v = <div>{view === 'a' ? <A /> : <B />}</div>;")
+        conds = [n for n in nodes if n[KIND] == 'cond']
+        self.assertEqual([(n[NAME], n[TEXT]) for n in conds], [('?', "view === 'a'")])
+        self.assertEqual([n[NAME] for n in nodes if n[KIND] == 'element'], ['div', 'A', 'B'])
+
+    def test_expression_without_jsx_is_expr(self):
+        nodes = self.parse('const v = <p>{a && b}</p>;')
+        self.assertEqual([(n[KIND], n[TEXT]) for n in nodes if n[KIND] != 'element'], [('expr', 'a && b')])
+
+    def test_comparisons_generics_and_regexes_are_not_elements(self):
+        source = (
+            'if (a < b && c > d) {}\n'
+            'const [s, setS] = useState<string>(\'\');\n'
+            'const re = /<div>/g;\n'
+            'const ok = x.replace(/<[^>]+>/, "");\n'
+        )
+        self.assertEqual([n for n in self.parse(source) if n[KIND] == 'element'], [])
+
+    def test_props(self):
+        nodes = self.parse('const v = <Foo a={1} b="two" c />;')
+        self.assertEqual([(n[NAME], n[TEXT]) for n in nodes if n[KIND] == 'prop'],
+                         [('a', '1'), ('b', 'two'), ('c', 'true')])
+
+
+class QueryTest(unittest.TestCase):
+    SOURCE = """const v = (
+  <A>
+    <B title="x[0]" label="it's">
+      <C />
+    </B>
+    {show && <C />}
+  </A>
+);
+"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = index_for(self.tmp.name, self.SOURCE)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def names(self, query):
+        return [node[NAME] for _, node in compile_query(query).run(self.index)]
+
+    def test_child_vs_descendant(self):
+        self.assertEqual(self.names('element[name=A] > element[name=C]'), [])
+        self.assertEqual(self.names('element[name=A] element[name=C]'), ['C', 'C'])
+        self.assertEqual(self.names('element[name=B] > element[name=C]'), ['C'])
+        self.assertEqual(self.names('cond > element'), ['C'])
+
+    def test_quoted_values(self):
+        self.assertEqual(self.names('prop[value="x[0]"]'), ['title'])
+        self.assertEqual(self.names('prop[value="it\'s"]'), ['label'])
+        self.assertEqual(self.names("prop[value='it\\'s']"), ['label'])
+
+    def test_operators(self):
+        self.assertEqual(self.names('prop[name~=itl]'), ['title'])
+        self.assertEqual(self.names('prop[value^=it]'), ['label'])
+        self.assertEqual(self.names('prop[value$="]"]'), ['title'])
+        self.assertEqual(self.names('element[name!=C]'), ['A', 'B'])
+        self.assertEqual(self.names('cond[test=show]'), ['&&'])
+
+    def test_invalid_queries(self):
+        for bad in ('div', 'element[name=A', 'element >', 'element[size=1]', 'element[name=A]x'):
+            with self.subTest(query=bad):
+                with self.assertRaises(QueryError):
+                    compile_query(bad)
+
+
+class ApplyEditsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = index_for(self.tmp.name, NESTED, 'Card.tsx')
+        self.path = os.path.join(self.tmp.name, 'Card.tsx')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def test_remove_nested_matches_removes_outermost(self):
+        matches = list(compile_query('element[name=Box]').run(self.index))
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(apply_edits(matches, 'remove', '', dry_run=False), [self.path])
+        text = self.read()
+        self.assertNotIn('Box', text)
+        self.assertNotIn('<span>', text)
+        self.assertIn('<p>after</p>', text)
+
+    def test_replace_nested_matches_edits_outermost_once(self):
+        matches = list(compile_query('element[name=Box]').run(self.index))
+        # Inner match first, as a caller might pass them
+        matches.reverse()
+        apply_edits(matches, 'replace', '<Panel />', dry_run=False)
+        text = self.read()
+        self.assertEqual(text.count('<Panel />'), 1)
+        self.assertNotIn('Box', text)
+        self.assertIn('<p>after</p>', text)
+
+    def test_sibling_matches_are_all_edited(self):
+        matches = list(compile_query('element[name=span]').run(self.index))
+        self.assertEqual(len(matches), 2)
+        apply_edits(matches, 'replace', '<em>x</em>', dry_run=False)
+        text = self.read()
+        self.assertEqual(text.count('<em>x</em>'), 2)
+        self.assertNotIn('<span>', text)
+
+
+class PlanEditTest(unittest.TestCase):
+    def edit(self, source, query, op, payload):
+        with tempfile.TemporaryDirectory() as tmp:
+            (_, node), = compile_query(query).run(index_for(tmp, source))
+        s, e, new = plan_edit(source, node, op, payload)
+        return source[:s] + new + source[e:]
+
+    def test_prop_after_short_shorthand_prop_uses_prop_indent(self):
+        source = 'const x = (\n    <Foo\n      a={1}\n      b\n    />\n);\n'
+        self.assertEqual(self.edit(source, 'element[name=Foo]', 'prop', 'c={2}'),
+                         'const x = (\n    <Foo\n      a={1}\n      b\n      c={2}\n    />\n);\n')
+
+
+    def test_prop_on_single_line_tag(self):
+        self.assertEqual(self.edit('const x = <Foo a={1} />;\n', 'element[name=Foo]', 'prop', 'b'),
+                         'const x = <Foo a={1} b />;\n')
+        self.assertEqual(self.edit('const x = <Foo>hi</Foo>;\n', 'element[name=Foo]', 'prop', 'b="c"'),
+                         'const x = <Foo b="c">hi</Foo>;\n')
+
+    def test_prop_needs_element(self):
+        with self.assertRaises(QueryError):
+            self.edit('const x = <Foo a={1} />;\n', 'prop[name=a]', 'prop', 'b')
+
+    def test_before_and_after_use_node_indent(self):
+        source = 'const x = (\n  <div>\n    <Foo />\n  </div>\n);\n'
+        self.assertEqual(self.edit(source, 'element[name=Foo]', 'before', '<Bar />'),
+                         'const x = (\n  <div>\n    <Bar />\n    <Foo />\n  </div>\n);\n')
+        self.assertEqual(self.edit(source, 'element[name=Foo]', 'after', '<Bar>\n  x\n</Bar>'),
+                         'const x = (\n  <div>\n    <Foo />\n    <Bar>\n      x\n    </Bar>\n  </div>\n);\n')
+
+    def test_remove_prop(self):
+        self.assertEqual(self.edit('const x = <Foo a={1} b="2" />;\n', 'prop[name=a]', 'remove', ''),
+                         'const x = <Foo b="2" />;\n')
+        source = 'const x = (\n  <Foo\n    a={1}\n    b\n  />\n);\n'
+        self.assertEqual(self.edit(source, 'prop[name=b]', 'remove', ''),
+                         'const x = (\n  <Foo\n    a={1}\n  />\n);\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,735 @@
+import argparse
+import bisect
+import difflib
+import functools
+import glob
+import os
+import pickle
+import re
+import sys
+import time
+
+# Structural search & patch for the TSX sources.
+#
+# Instead of hard-coding a text block per fix script, describe the node:
+#
+#   python tsxq.py find "element[name=ProductListHeader] > prop[name=sortOrder]"
+#   python tsxq.py find "cond[test~=\"view === 'promos'\"]" --show
+#   python tsxq.py insert "element[name=ProductListHeader]" --prop "searchTerm={searchTerm}"
+#   python tsxq.py insert "cond[test^=\"view === 'dashboard'\"]" --before-file promos_view.txt
+#   python tsxq.py replace "element[name=Hero] > prop[name=slides]" --with "slides={heroSlides}"
+#   python tsxq.py remove "element[name=WhatsAppButton]" --dry-run
+#
+# Query syntax
+#   step        kind[attr op value][...]   kind: element | prop | cond | expr | *
+#   attrs       name, test, value, file, line
+#   ops         =  exact     != not equal   ~= contains   ^= starts with   $= ends with
+#   combinators "a > b" (b is a direct child of a)   "a b" (b is anywhere inside a)
+#
+# The files are parsed once into a node index cached in .tsxq_index; a file is
+# only re-parsed when its mtime or size changes.
+
+SOURCE_GLOBS = ['*.tsx', 'components/**/*.tsx', 'hooks/**/*.tsx']
+INDEX_FILE = '.tsxq_index'
+INDEX_VERSION = 1
+
+# Node tuple layout: (kind, name, text, start, end, line, parent)
+KIND, NAME, TEXT, START, END, LINE, PARENT = range(7)
+
+NAME_CHARS = re.compile(r'[\w.:$-]*')
+PROP_NAME = re.compile(r'[\w:$-]+')
+WS = re.compile(r'\s*')
+PREV_WORD = re.compile(r'(\w+)\s*$')
+JSX_KEYWORDS = ('return', 'yield', 'default', 'case', 'else', 'do')
+
+
+# ---------------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------------
+
+class TsxParser:
+    # Small JSX-aware scanner. It doesn't build a full TS AST: it walks the JS
+    # just well enough (strings, templates, comments, regex literals, brackets)
+    # to find JSX elements, their props and the {...} containers between them.
+
+    def __init__(self, text):
+        self.text = text
+        self.n = len(text)
+        self.nodes = []
+        self.stack = []
+
+    def add(self, kind, name, text, start, end=None):
+        parent = self.stack[-1] if self.stack else -1
+        self.nodes.append([kind, name, text, start, end, 0, parent])
+        return len(self.nodes) - 1
+
+    def parse(self):
+        self.scan_js(0, None)
+        newlines = [m.start() for m in re.finditer('\n', self.text)]
+        for node in self.nodes:
+            node[LINE] = bisect.bisect_right(newlines, node[START] - 1) + 1
+        return [tuple(n) for n in self.nodes]
+
+    # --- JS ---------------------------------------------------------------
+
+    def jsx_starts_at(self, i):
+        t = self.text
+        if i + 1 >= self.n or not (t[i + 1].isalpha() or t[i + 1] in '>_$'):
+            return False
+        j = i - 1
+        while j >= 0 and t[j] in ' \t\r\n':
+            j -= 1
+        if j < 0:
+            return True
+        prev = t[j]
+        if prev.isalnum() or prev in '_$':
+            # "return <div>" is JSX, "useState<string>" / "a < b" are not
+            m = PREV_WORD.search(t, max(0, j - 10), j + 1)
+            return bool(m) and m.group(1) in JSX_KEYWORDS
+        return prev in '(=,?:{[&|;!>}'
+
+    def regex_allowed(self, i):
+        j = i - 1
+        while j >= 0 and self.text[j] in ' \t\r\n':
+            j -= 1
+        return j < 0 or self.text[j] in '(,=:[!&|?{};'
+
+    def skip_string(self, i):
+        quote = self.text[i]
+        i += 1
+        while i < self.n and self.text[i] != quote:
+            if self.text[i] == '\\':
+                i += 1
+            elif self.text[i] == '\n':
+                break
+            i += 1
+        return i + 1
+
+    def skip_template(self, i):
+        i += 1
+        while i < self.n and self.text[i] != '`':
+            if self.text[i] == '\\':
+                i += 2
+                continue
+            if self.text.startswith('${', i):
+                i = self.scan_js(i + 2, '}')
+                continue
+            i += 1
+        return i + 1
+
+    def skip_regex(self, i):
+        i += 1
+        in_class = False
+        while i < self.n:
+            ch = self.text[i]
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == '\n':
+                return i
+            if ch == '[':
+                in_class = True
+            elif ch == ']':
+                in_class = False
+            elif ch == '/' and not in_class:
+                i += 1
+                break
+            i += 1
+        while i < self.n and self.text[i].isalpha():
+            i += 1
+        return i
+
+    def scan_js(self, i, close, ops=None):
+        # Scans until the unbalanced `close` char and returns the index after it.
+        # Top-level "&&" / "?" positions are collected in `ops` for cond detection.
+        t = self.text
+        depth = 0
+        while i < self.n:
+            ch = t[i]
+            if ch in '\'"':
+                i = self.skip_string(i)
+            elif ch == '`':
+                i = self.skip_template(i)
+            elif t.startswith('//', i):
+                nl = t.find('\n', i)
+                i = self.n if nl == -1 else nl + 1
+            elif t.startswith('/*', i):
+                end = t.find('*/', i + 2)
+                i = self.n if end == -1 else end + 2
+            elif ch == '/' and self.regex_allowed(i):
+                i = self.skip_regex(i)
+            elif ch == '<' and self.jsx_starts_at(i):
+                i = self.parse_element(i)
+            elif ch in '([{':
+                depth += 1
+                i += 1
+            elif ch in ')]}':
+                if depth == 0:
+                    return i + 1 if ch == close else i
+                depth -= 1
+                i += 1
+            else:
+                if ops is not None and depth == 0:
+                    if t.startswith('&&', i):
+                        ops.append(('&&', i))
+                        i += 2
+                        continue
+                    if ch == '?' and t[i + 1:i + 2] not in ('.', '?') and t[i - 1:i] != '?':
+                        ops.append(('?', i))
+                i += 1
+        return i
+
+    # --- JSX --------------------------------------------------------------
+
+    def parse_element(self, i):
+        t = self.text
+        m = NAME_CHARS.match(t, i + 1)
+        name = m.group(0) or '<>'
+        node = self.add('element', name, None, i)
+        self.stack.append(node)
+        i = m.end()
+
+        # Props
+        self_closing = False
+        while i < self.n:
+            i = WS.match(t, i).end()
+            if t.startswith('/>', i):
+                i += 2
+                self_closing = True
+                break
+            if t[i] == '>':
+                i += 1
+                break
+            if t[i] == '{':
+                # {...spread}
+                i = self.scan_js(i + 1, '}')
+                continue
+            if t.startswith('/*', i) or t.startswith('//', i):
+                i = self.scan_js_comment(i)
+                continue
+            pm = PROP_NAME.match(t, i)
+            if not pm:
+                i += 1
+                continue
+            prop = self.add('prop', pm.group(0), None, i)
+            i = WS.match(t, pm.end()).end()
+            value_start = i
+            if i < self.n and t[i] == '=':
+                i = WS.match(t, i + 1).end()
+                value_start = i
+                self.stack.append(prop)
+                if t[i] in '\'"':
+                    end = t.find(t[i], i + 1)
+                    i = end + 1
+                elif t[i] == '{':
+                    i = self.scan_js(i + 1, '}')
+                elif t[i] == '<':
+                    i = self.parse_element(i)
+                self.stack.pop()
+                self.nodes[prop][TEXT] = strip_value(t[value_start:i])
+            else:
+                i = pm.end()
+                self.nodes[prop][TEXT] = 'true'
+            self.nodes[prop][END] = i
+
+        if not self_closing:
+            i = self.parse_children(i, name)
+
+        self.stack.pop()
+        self.nodes[node][END] = i
+        return i
+
+    def scan_js_comment(self, i):
+        if self.text.startswith('//', i):
+            nl = self.text.find('\n', i)
+            return self.n if nl == -1 else nl + 1
+        end = self.text.find('*/', i + 2)
+        return self.n if end == -1 else end + 2
+
+    def parse_children(self, i, name):
+        t = self.text
+        while i < self.n:
+            ch = t[i]
+            if t.startswith('</', i):
+                end = t.find('>', i)
+                return self.n if end == -1 else end + 1
+            if ch == '<':
+                i = self.parse_element(i)
+            elif ch == '{':
+                i = self.parse_container(i)
+            else:
+                i += 1
+        return i
+
+    def parse_container(self, i):
+        # {expr} inside JSX children. Becomes a "cond" node when it's
+        # "{test && (...)}" or "{test ? a : b}", otherwise an "expr" node.
+        node = self.add('expr', None, None, i)
+        self.stack.append(node)
+        ops = []
+        count_before = len(self.nodes)
+        end = self.scan_js(i + 1, '}', ops)
+        self.stack.pop()
+
+        has_jsx = any(n[KIND] == 'element' for n in self.nodes[count_before:])
+        inner = self.text[i + 1:end - 1]
+        ternary = [p for op, p in ops if op == '?']
+        ands = [p for op, p in ops if op == '&&']
+        n = self.nodes[node]
+        if has_jsx and ternary:
+            n[KIND], n[NAME], n[TEXT] = 'cond', '?', squash(self.text[i + 1:ternary[0]])
+        elif has_jsx and ands:
+            n[KIND], n[NAME], n[TEXT] = 'cond', '&&', squash(self.text[i + 1:ands[-1]])
+        else:
+            n[TEXT] = squash(inner)
+        n[END] = end
+        return end
+
+
+def strip_value(raw):
+    raw = raw.strip()
+    if len(raw) >= 2 and raw[0] in '{\'"' and raw[-1] in '}\'"':
+        raw = raw[1:-1]
+    return squash(raw)
+
+
+def squash(text):
+    return ' '.join(text.split())
+
+
+def parse_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return TsxParser(f.read()).parse()
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class Index:
+    def __init__(self, path=INDEX_FILE):
+        self.path = path
+        self.files = {}
+        self.dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    data = pickle.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    self.files = data['files']
+            except (OSError, pickle.UnpicklingError, EOFError):
+                self.files = {}
+
+    def refresh(self, paths):
+        for path in paths:
+            st = os.stat(path)
+            key = (st.st_mtime_ns, st.st_size)
+            entry = self.files.get(path)
+            if entry is None or entry['key'] != key:
+                self.files[path] = {'key': key, 'nodes': parse_file(path)}
+                self.dirty = True
+        for path in list(self.files):
+            if path not in paths:
+                del self.files[path]
+                self.dirty = True
+
+    def save(self):
+        if self.dirty:
+            with open(self.path, 'wb') as f:
+                pickle.dump({'version': INDEX_VERSION, 'files': self.files}, f, pickle.HIGHEST_PROTOCOL)
+            self.dirty = False
+
+
+def collect_sources(patterns):
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            path = os.path.normpath(path)
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+STEP_RE = re.compile(r'\s*(element|prop|cond|expr|\*)')
+ATTR_RE = re.compile(r'\[\s*(name|test|value|file|line)\s*(=|!=|~=|\^=|\$=)\s*'
+                     r'(?:"((?:[^"\\]|\\.)*)"|\'((?:[^\'\\]|\\.)*)\'|([^\]\s]+))\s*\]')
+COMBINATOR_RE = re.compile(r'\s*(>)\s*|\s+')
+
+OPS = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '~=': lambda a, b: b in a,
+    '^=': lambda a, b: a.startswith(b),
+    '$=': lambda a, b: a.endswith(b),
+}
+
+
+class QueryError(ValueError):
+    pass
+
+
+class Query:
+    def __init__(self, source, steps):
+        self.source = source
+        # steps: [(combinator, kind, [(attr, op, value)])], combinator of the first step is None
+        self.steps = steps
+
+    def step_matches(self, step, node, path):
+        _, kind, attrs = step
+        if kind != '*' and node[KIND] != kind:
+            return False
+        for attr, op, value in attrs:
+            if attr == 'name':
+                actual = node[NAME] or ''
+            elif attr in ('test', 'value'):
+                actual = node[TEXT] or ''
+            elif attr == 'file':
+                actual = path
+            else:
+                actual = str(node[LINE])
+            if not OPS[op](actual, value):
+                return False
+        return True
+
+    def matches(self, nodes, idx, path, step_i=None):
+        step_i = len(self.steps) - 1 if step_i is None else step_i
+        if not self.step_matches(self.steps[step_i], nodes[idx], path):
+            return False
+        if step_i == 0:
+            return True
+        combinator = self.steps[step_i][0]
+        parent = nodes[idx][PARENT]
+        if combinator == '>':
+            return parent >= 0 and self.matches(nodes, parent, path, step_i - 1)
+        while parent >= 0:
+            if self.matches(nodes, parent, path, step_i - 1):
+                return True
+            parent = nodes[parent][PARENT]
+        return False
+
+    def run(self, index):
+        kind = self.steps[-1][1]
+        for path, entry in index.files.items():
+            nodes = entry['nodes']
+            for idx, node in enumerate(nodes):
+                if (kind == '*' or node[KIND] == kind) and self.matches(nodes, idx, path):
+                    yield path, node
+
+
+@functools.lru_cache(maxsize=128)
+def compile_query(source):
+    steps = []
+    i = 0
+    combinator = None
+    while True:
+        m = STEP_RE.match(source, i)
+        if not m:
+            raise QueryError('expected element/prop/cond/expr/* at %r' % source[i:])
+        kind = m.group(1)
+        i = m.end()
+        attrs = []
+        while True:
+            am = ATTR_RE.match(source, i)
+            if not am:
+                break
+            raw = next(g for g in am.groups()[2:] if g is not None)
+            attrs.append((am.group(1), am.group(2), re.sub(r'\\(.)', r'\1', raw)))
+            i = am.end()
+        steps.append((combinator, kind, attrs))
+        if i >= len(source.rstrip()):
+            break
+        cm = COMBINATOR_RE.match(source, i)
+        if not cm or cm.end() == i:
+            raise QueryError('unexpected %r' % source[i:])
+        combinator = '>' if cm.group(1) else ' '
+        i = cm.end()
+    return Query(source, steps)
+
+
+# ---------------------------------------------------------------------------
+# Edits
+# ---------------------------------------------------------------------------
+
+def line_indent(text, pos):
+    start = text.rfind('\n', 0, pos) + 1
+    return re.match(r'[ \t]*', text[start:]).group(0)
+
+
+def indent_block(block, indent):
+    lines = block.strip('\n').split('\n')
+    base = min((len(l) - len(l.lstrip()) for l in lines if l.strip()), default=0)
+    return '\n'.join(indent + l[base:] if l.strip() else '' for l in lines)
+
+
+def full_line_span(text, start, end):
+    # Widen to whole lines when the node is alone on its lines
+    ls = text.rfind('\n', 0, start) + 1
+    le = text.find('\n', end)
+    le = len(text) if le == -1 else le + 1
+    if not text[ls:start].strip() and not text[end:le].strip():
+        return ls, le
+    return start, end
+
+
+def plan_edit(text, node, op, payload):
+    start, end = node[START], node[END]
+    indent = line_indent(text, start)
+
+    if op == 'replace':
+        body = payload.strip('\n')
+        if '\n' in body:
+            body = indent_block(body, indent).lstrip()
+        return start, end, body
+
+    if op == 'remove':
+        if node[KIND] == 'prop':
+            # Take the whitespace before the prop with it
+            s = start
+            while s > 0 and text[s - 1] in ' \t\r\n':
+                s -= 1
+            return s, end, ''
+        s, e = full_line_span(text, start, end)
+        return s, e, ''
+
+    if op in ('before', 'after'):
+        block = indent_block(payload, indent)
+        if op == 'before':
+            ls = text.rfind('\n', 0, start) + 1
+            return ls, ls, block + '\n'
+        le = text.find('\n', end)
+        le = len(text) if le == -1 else le + 1
+        return le, le, block + '\n'
+
+    if op == 'prop':
+        if node[KIND] != 'element':
+            raise QueryError('--prop needs an element match')
+        # Insert right before "/>" or ">" of the opening tag
+        tag_end = opening_tag_end(text, node)
+        close = tag_end - 2 if text[tag_end - 2:tag_end] == '/>' else tag_end - 1
+        before = text[start:close]
+        if '\n' in before:
+            s = close
+            while s > start and text[s - 1] in ' \t\r\n':
+                s -= 1
+            # Line up with the last prop, not with whatever line "/>" sits on
+            last = last_prop_start(text, node)
+            prop_indent = indent + '  ' if last is None else line_indent(text, last)
+            return s, s, '\n' + prop_indent + payload.strip()
+        s = close
+        while s > start and text[s - 1] in ' \t':
+            s -= 1
+        return s, s, ' ' + payload.strip()
+
+    if op in ('prepend', 'append'):
+        if node[KIND] != 'element' or text[end - 2:end] == '/>':
+            raise QueryError('--%s needs an element with children' % op)
+        child_indent = indent + '  '
+        block = indent_block(payload, child_indent)
+        if op == 'prepend':
+            pos = opening_tag_end(text, node)
+            return pos, pos, '\n' + block
+        pos = text.rfind('</', start, end)
+        ls = text.rfind('\n', 0, pos) + 1
+        if not text[ls:pos].strip():
+            return ls, ls, block + '\n'
+        return pos, pos, block
+
+    raise QueryError('unknown operation %s' % op)
+
+
+def opening_tag_end(text, element):
+    # End of "<Name ...>": the first ">" that isn't inside a prop value
+    parser = TsxParser(text)
+    i = NAME_CHARS.match(text, element[START] + 1).end()
+    while i < parser.n:
+        i = WS.match(text, i).end()
+        if text.startswith('/>', i):
+            return i + 2
+        if text[i] == '>':
+            return i + 1
+        if text[i] == '{':
+            i = parser.scan_js(i + 1, '}')
+        elif text[i] in '\'"':
+            i = text.find(text[i], i + 1) + 1
+        else:
+            i += 1
+    return i
+
+
+def last_prop_start(text, element):
+    # Start of the element's last prop (spreads aren't props), or None
+    parser = TsxParser(text)
+    parser.parse_element(element[START])
+    props = [n for n in parser.nodes if n[KIND] == 'prop' and n[PARENT] == 0]
+    return props[-1][START] if props else None
+
+
+def apply_edits(matches, op, payload, dry_run):
+    by_file = {}
+    for path, node in matches:
+        by_file.setdefault(path, []).append(node)
+
+    changed = []
+    for path, nodes in by_file.items():
+        with open(path, 'r', encoding='utf-8') as f:
+            original = f.read()
+        text = original
+        # Outermost first: a match nested inside an accepted one is edited along with it
+        accepted = []
+        for node in sorted(nodes, key=lambda n: (n[START], -n[END])):
+            if accepted and node[END] <= accepted[-1][END]:
+                continue
+            accepted.append(node)
+        # Back to front so earlier offsets stay valid
+        for node in reversed(accepted):
+            s, e, new = plan_edit(text, node, op, payload)
+            text = text[:s] + new + text[e:]
+        if text == original:
+            continue
+        changed.append(path)
+        if dry_run:
+            sys.stdout.writelines(difflib.unified_diff(
+                original.splitlines(True), text.splitlines(True), 'a/' + path, 'b/' + path))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+    return changed
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def describe(node):
+    kind, name, text = node[KIND], node[NAME], node[TEXT]
+    if kind == 'element':
+        return '<%s>' % name
+    if kind == 'prop':
+        return '%s={%s}' % (name, shorten(text))
+    if kind == 'cond':
+        return '{%s %s ...}' % (shorten(text), name)
+    return '{%s}' % shorten(text)
+
+
+def shorten(text, width=60):
+    text = text or ''
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def read_payload(args):
+    if args.with_file:
+        with open(args.with_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    return args.text
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Structural search & patch for TSX files.')
+    parser.add_argument('--index', default=INDEX_FILE, help='index cache file (default: %(default)s)')
+    parser.add_argument('--time', action='store_true', help='print timings to stderr')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_find = sub.add_parser('find', help='list matching nodes')
+    p_find.add_argument('query')
+    p_find.add_argument('--show', action='store_true', help='print the matched source')
+
+    p_index = sub.add_parser('index', help='(re)build the index and print stats')
+    p_index.add_argument('--rebuild', action='store_true')
+
+    def edit_parser(name, help_text, with_text=True):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('query')
+        p.add_argument('--all', action='store_true', help='allow editing more than one match')
+        p.add_argument('--dry-run', action='store_true', help='print a diff instead of writing')
+        if with_text:
+            p.add_argument('--with', dest='text', help='new text')
+            p.add_argument('--with-file', help='read the new text from a file')
+        return p
+
+    edit_parser('replace', 'replace matching nodes')
+    edit_parser('remove', 'remove matching nodes', with_text=False)
+    p_insert = edit_parser('insert', 'insert text around/inside matching nodes', with_text=False)
+    where = p_insert.add_mutually_exclusive_group(required=True)
+    for flag in ('before', 'after', 'prepend', 'append', 'prop'):
+        where.add_argument('--' + flag, metavar='TEXT')
+        where.add_argument('--%s-file' % flag, metavar='PATH')
+
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    index = Index(args.index)
+    if args.command == 'index' and args.rebuild:
+        index.files = {}
+    index.refresh(collect_sources(SOURCE_GLOBS))
+    index.save()
+    t1 = time.perf_counter()
+
+    if args.command == 'index':
+        total = sum(len(e['nodes']) for e in index.files.values())
+        print(f"{len(index.files)} files, {total:,} nodes -> {args.index}")
+        return
+
+    try:
+        query = compile_query(args.query)
+        matches = list(query.run(index))
+    except QueryError as e:
+        sys.exit(f"❌ Invalid query: {e}")
+    t2 = time.perf_counter()
+    if args.time:
+        print(f"index {(t1 - t0) * 1000:.1f} ms, query {(t2 - t1) * 1000:.1f} ms", file=sys.stderr)
+
+    if args.command == 'find':
+        for path, node in matches:
+            print(f"{path}:{node[LINE]}  {describe(node)}")
+            if args.show:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                s, e = node[START], node[END]
+                print(line_indent(text, s) + text[s:e])
+                print()
+        if not matches:
+            print("No matches.")
+            sys.exit(1)
+        return
+
+    if not matches:
+        sys.exit("❌ Query matched nothing, no changes made.")
+    if len(matches) > 1 and not args.all:
+        for path, node in matches[:20]:
+            print(f"  {path}:{node[LINE]}  {describe(node)}")
+        if len(matches) > 20:
+            print(f"  ... and {len(matches) - 20} more")
+        sys.exit(f"❌ Query matched {len(matches)} nodes; narrow it down or pass --all.")
+
+    if args.command == 'remove':
+        op, payload = 'remove', ''
+    elif args.command == 'replace':
+        op, payload = 'replace', read_payload(args)
+        if payload is None:
+            sys.exit("❌ replace needs --with or --with-file")
+    else:
+        for flag in ('before', 'after', 'prepend', 'append', 'prop'):
+            if getattr(args, flag) is not None:
+                op, payload = flag, getattr(args, flag)
+            elif getattr(args, flag + '_file') is not None:
+                with open(getattr(args, flag + '_file'), 'r', encoding='utf-8') as f:
+                    op, payload = flag, f.read()
+
+    try:
+        changed = apply_edits(matches, op, payload, args.dry_run)
+    except QueryError as e:
+        sys.exit(f"❌ {e}")
+
+    if not args.dry_run:
+        index.refresh(collect_sources(SOURCE_GLOBS))
+        index.save()
+        for path in changed:
+            print(f"✅ Updated {path}")
+
+
+if __name__ == '__main__':
+    main()